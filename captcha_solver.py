@@ -1,30 +1,82 @@
+import os
 import time
 import random
-import traceback
+import sys
+import threading
 from datetime import datetime
 from colorama import Fore, Style
+from selenium.webdriver.common.by import By
 from temu_captcha_solver.launcher import make_undetected_chromedriver_solver
 from temu_captcha_solver import CaptchaSolvingException
+from config import get_config
 from logger import setup_logger
 
 logger = setup_logger()
 
+MANUAL_POLL_MIN = 0.25
+MANUAL_POLL_MAX = 2.0
+
+_BANNER = "\n".join([
+    f"\n{Fore.YELLOW}{'=' * 80}",
+    f"{Fore.RED}ACTION REQUIRED:{Style.RESET_ALL} Please solve the CAPTCHA manually!",
+    "After solving, the bot will continue automatically",
+    f"{'=' * 80}{Style.RESET_ALL}\n\n"
+]).encode()
+
+def _enable_vt_mode():
+    # Let the Windows console interpret raw ANSI codes without colorama's wrapper
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except Exception:
+        pass
+
+def _write_banner():
+    stream = sys.__stdout__
+    if stream is None or not hasattr(stream, 'buffer'):
+        sys.stdout.write(_BANNER.decode())
+        sys.stdout.flush()
+        return
+    stream.flush()
+    stream.buffer.write(_BANNER)
+    stream.buffer.flush()
+
+_enable_vt_mode()
+
 class CaptchaSolver:
     def __init__(self, verbose=False):
-        from config import Config
-        config = Config()
+        config = get_config()
         self.api_key = config.CAPTCHA_API_KEY
         self.verbose = verbose
+        self._rng = random.Random()
+        self._solver = None
+        
+    def _countdown(self, deadline, solved):
+        # Report the remaining manual-solving time every 10 seconds until done
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            logger.info(f"Manual CAPTCHA solving time remaining: {remaining:.0f} seconds")
+            if solved.wait(min(10, remaining)):
+                return
         
     def solve(self, driver):
         try:
-            wait_time = random.uniform(2, 5)
+            wait_time = self._rng.uniform(2, 5)
             logger.info(f"Waiting {wait_time:.2f} seconds before CAPTCHA solving")
             time.sleep(wait_time)
             
             logger.info("Attempting to solve CAPTCHA")
-            solver = make_undetected_chromedriver_solver(api_key=self.api_key)
-            solver(driver)
+            if self._solver is None:
+                self._solver = make_undetected_chromedriver_solver(api_key=self.api_key)
+            self._solver(driver)
             
             logger.success("CAPTCHA solved successfully")
             return True
@@ -32,38 +84,37 @@ class CaptchaSolver:
         except CaptchaSolvingException as e:
             logger.error(f"CAPTCHA solving failed: {str(e)}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             
-            wait_time = random.uniform(30, 60)
+            wait_time = self._rng.uniform(30, 60) + 120
             logger.warning("Manual CAPTCHA solving required")
-            logger.info(f"Bot will pause for {wait_time:.2f} seconds")
+            logger.info(f"Bot will wait up to {wait_time:.2f} seconds")
             
-            for i in range(int(wait_time)):
-                if i % 10 == 0:
-                    remaining = wait_time - i
-                    logger.info(f"Manual CAPTCHA solving time remaining: {remaining:.0f} seconds")
-                time.sleep(1)
+            _write_banner()
             
-            print(f"\n{Fore.YELLOW}{'=' * 80}")
-            print(f"{Fore.RED}ACTION REQUIRED:{Style.RESET_ALL} Please solve the CAPTCHA manually!")
-            print("After solving, the bot will continue automatically")
-            print(f"{'=' * 80}{Style.RESET_ALL}\n")
+            deadline = time.monotonic() + wait_time
+            solved = threading.Event()
+            countdown = threading.Thread(
+                target=self._countdown, args=(deadline, solved), daemon=True
+            )
+            countdown.start()
             
             try:
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support import expected_conditions as EC
-                from selenium.common.exceptions import TimeoutException
+                # Poll quickly at first so the bot resumes as soon as the user is done,
+                # then back off to avoid hammering the driver during long waits
+                poll = MANUAL_POLL_MIN
+                while time.monotonic() < deadline:
+                    if driver.find_elements(By.XPATH, "//input[@aria-label='Password']"):
+                        return True
+                    time.sleep(min(poll, max(0, deadline - time.monotonic())))
+                    poll = min(poll * 2, MANUAL_POLL_MAX)
                 
-                WebDriverWait(driver, 120).until(
-                    EC.presence_of_element_located((By.XPATH, "//input[@aria-label='Password']"))
-                )
-                return True
-            except TimeoutException:
                 logger.error("Manual CAPTCHA solving timeout")
                 return False
+            finally:
+                solved.set()
         except Exception as e:
             logger.error(f"Unexpected error during CAPTCHA solving: {str(e)}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             return False
\ No newline at end of file
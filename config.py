@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 class Config:
@@ -8,7 +9,13 @@ class Config:
         self.PASSWORD = os.getenv("TEMU_PASSWORD")
         self.SESSION_FILE = "session.json"
         self.ORDERS_FILE = "orders.json"
-        self.LOG_FILE = "temu_bot.log"
+        self.ORDERS_JOURNAL_FILE = "orders.jsonl"
+        self.LOG_FILE = os.getenv("TEMU_LOG_FILE", "temu_bot.log")
         self.ML_MODEL_PATH = "success_model.pkl"
         self.CAPTCHA_API_KEY = os.getenv("CAPTCHA_API_KEY")
-        self.ORDERS_FOLDER = "orders"
\ No newline at end of file
+        self.ORDERS_FOLDER = "orders"
+
+@lru_cache(maxsize=1)
+def get_config():
+    # Parse .env only once per process; every caller shares this instance
+    return Config()
\ No newline at end of file
@@ -1,11 +1,19 @@
+import atexit
+import io
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import threading
 from colorama import Fore, Style, init
-from config import Config
 
 init(autoreset=True)
 
+LOG_FILE = os.environ.get("TEMU_LOG_FILE", "temu_bot.log")
+
+SUCCESS = 25
+VERBOSE = 5
+
 LOG_COLORS = {
     'INFO': Fore.CYAN,
     'WARNING': Fore.YELLOW,
@@ -16,47 +24,122 @@ LOG_COLORS = {
     'VERBOSE': Fore.MAGENTA
 }
 
+_COLORED_LEVEL = {
+    name: f"{color}{name}{Style.RESET_ALL}" for name, color in LOG_COLORS.items()
+}
+
+_listener = None
+
 class ColoredFormatter(logging.Formatter):
     def format(self, record):
-        timestamp = datetime.now().strftime('%d.%m.%Y - %H:%M:%S')
-        levelname = record.levelname
-        message = super().format(record)
+        timestamp = self.formatTime(record, self.datefmt)
+        levelname = _COLORED_LEVEL.get(record.levelname, record.levelname)
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = "%s\n%s" % (message, record.exc_text)
         
-        if levelname in LOG_COLORS:
-            color = LOG_COLORS[levelname]
-            levelname = f"{color}{levelname}{Style.RESET_ALL}"
-        
-        return f"{Fore.LIGHTBLACK_EX}{timestamp}{Style.RESET_ALL} - {levelname} - {message}"
+        return "%s%s%s - %s - %s" % (
+            Fore.LIGHTBLACK_EX, timestamp, Style.RESET_ALL, levelname, message
+        )
+
+class BufferedFileHandler(logging.StreamHandler):
+    """File handler that batches writes in memory and flushes them periodically."""
+    
+    def __init__(self, filename, mode='w', buffer_size=65536, flush_interval=0.2):
+        raw = open(filename, mode + 'b', buffering=0)
+        stream = io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=buffer_size),
+            encoding='utf-8',
+            write_through=False,
+            line_buffering=False
+        )
+        super().__init__(stream)
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, args=(flush_interval,), daemon=True
+        )
+        self._flusher.start()
+    
+    def emit(self, record):
+        # Same as StreamHandler.emit, minus the flush after every record
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self, interval):
+        while not self._closing.wait(interval):
+            self.flush()
+    
+    def close(self):
+        self._closing.set()
+        self._flusher.join()
+        self.acquire()
+        try:
+            if not self.stream.closed:
+                self.stream.flush()
+                self.stream.close()
+        finally:
+            self.release()
+        super().close()
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves all formatting, tracebacks included, to the listener thread."""
+    
+    def prepare(self, record):
+        # The listener runs in this process, so the record can cross threads unformatted
+        return record
 
 def setup_logger(verbose=False):
+    global _listener
     logger = logging.getLogger("temu_bot")
-    logger.handlers = []
-    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.setLevel(VERBOSE if verbose else logging.INFO)
+    
+    # Handlers are built once per process; later calls only adjust the level
+    if getattr(logger, '_configured', False):
+        return logger
     
     # Console handler
     ch = logging.StreamHandler()
-    ch_formatter = ColoredFormatter('%(message)s')
+    ch_formatter = ColoredFormatter('%(message)s', datefmt='%d.%m.%Y - %H:%M:%S')
     ch.setFormatter(ch_formatter)
-    logger.addHandler(ch)
     
-    # File handler (overwrite each run)
-    config = Config()
-    fh = logging.FileHandler(config.LOG_FILE, mode='w')
+    # File handler (overwritten once per process)
+    fh = BufferedFileHandler(LOG_FILE, mode='w')
     fh_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%d.%m.%Y - %H:%M:%S'
     )
     fh.setFormatter(fh_formatter)
-    logger.addHandler(fh)
+    
+    # Hand records to a background listener so callers never block on I/O
+    log_queue = queue.Queue(-1)
+    logger.addHandler(RecordQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, ch, fh, respect_handler_level=True)
+    _listener.start()
     
     # Custom success log level
-    logging.addLevelName(25, "SUCCESS")
+    logging.addLevelName(SUCCESS, "SUCCESS")
     if not hasattr(logger, 'success'):
-        setattr(logger, 'success', lambda message, *args: logger._log(25, message, args))
+        setattr(logger, 'success', lambda message, *args, **kwargs: logger.log(SUCCESS, message, *args, **kwargs))
     
     # Custom verbose log level
-    logging.addLevelName(5, "VERBOSE")
+    logging.addLevelName(VERBOSE, "VERBOSE")
     if not hasattr(logger, 'verbose'):
-        setattr(logger, 'verbose', lambda message, *args: logger._log(5, message, args))
+        setattr(logger, 'verbose', lambda message, *args, **kwargs: logger.log(VERBOSE, message, *args, **kwargs))
     
-    return logger
\ No newline at end of file
+    logger._configured = True
+    return logger
+
+def _stop_listener():
+    # Drain pending records and release the handlers of the current listener
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(_stop_listener)
\ No newline at end of file
@@ -1,30 +1,45 @@
 import argparse
+import atexit
+import hashlib
 import json
 import os
 import random
+import queue
 import re
+import threading
 import time
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import numpy as np
 from colorama import Fore, Style
 from dotenv import load_dotenv
+
 from selenium import webdriver
 from selenium.common.exceptions import (
+    JavascriptException,
     NoSuchElementException,
-    StaleElementReferenceException,
-    TimeoutException
+    ScriptTimeoutException,
+    TimeoutException,
+    WebDriverException
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
-from sklearn.linear_model import LinearRegression
 
 from logger import setup_logger
-from utils import long_random_delay, random_delay, save_order_to_txt
+from utils import (
+    UPDATED_AT_FORMAT,
+    load_orders_index,
+    long_random_delay,
+    parse_delivery_date,
+    random_delay,
+    save_order_data,
+    save_order_to_txt,
+    write_orders_snapshot
+)
 
 # Load environment variables
 load_dotenv()
@@ -36,6 +51,298 @@ logger = setup_logger()
 SHORT_DELAY = (0.5, 5.0)
 LONG_DELAY = (10.0, 30.0)
 
+# Keep-alive connections to chromedriver
+DRIVER_POOL_SIZE = 20
+
+# Resources blocked after login; order, tracking and dialog data are all text
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.mp4",
+    "*google-analytics*", "*googletagmanager*", "*adsbygoogle*", "*doubleclick*"
+]
+
+# Account menu entry that only shows up for a logged-in session
+ORDERS_ACCOUNT_XPATH = "//div[text()='Orders & Account']"
+
+# Orders list locators
+ORDER_CARD_XPATH = "//div[contains(@class, '_2DCuXnC8') and @data-uniqid]"
+VIEW_MORE_XPATH = "//span[contains(text(),'View more')]/parent::div[@role='button']"
+LOADING_XPATH = "//span[contains(text(),'Loading')]"
+
+# Precompiled patterns for order and tracking parsing
+_PO_RE = re.compile(r'PO-[\w-]+')
+_ITEMS_RE = re.compile(r'(\d+)\s+items?')
+_WS_RE = re.compile(r'\s+')
+
+# Order date patterns, each with the only formats its match can be in
+_DATE_PATTERNS = [
+    (re.compile(r'([A-Z][a-z]{2} \d{1,2},? \d{4})'), ("%b %d %Y",)),
+    (re.compile(r'(\d{1,2} [A-Z][a-z]{2} \d{4})'), ("%d %b %Y",)),
+    (re.compile(r'(\d{1,2}/\d{1,2}/\d{4})'), ("%d/%m/%Y", "%m/%d/%Y")),
+    (re.compile(r'(\d{1,2}-\d{1,2}-\d{4})'), ("%d-%m-%Y", "%m-%d-%Y"))
+]
+
+# Walks (kind, selector) strategies in order inside the browser and returns the first match
+FIND_FIRST_JS = """
+const strategies = arguments[0];
+const visibleOnly = arguments[1];
+const isVisible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)
+    && getComputedStyle(e).visibility !== 'hidden' && !e.disabled;
+for (const [kind, selector] of strategies) {
+    let found = [];
+    if (kind === 'css') {
+        found = document.querySelectorAll(selector);
+    } else {
+        const r = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < r.snapshotLength; i++) found.push(r.snapshotItem(i));
+    }
+    for (const e of found) {
+        if (!visibleOnly || isVisible(e)) return e;
+    }
+}
+return null;
+"""
+
+# Returns [element, text] for the first visible XPath match containing a text, trying texts in order;
+# given a list of XPaths, each is tried in turn and the first one with a match wins
+PICK_VISIBLE_CONTAINING_JS = """
+const [xpaths, texts] = arguments;
+const isVisible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)
+    && getComputedStyle(e).visibility !== 'hidden';
+for (const xpath of [].concat(xpaths)) {
+    const r = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const visible = [];
+    for (let i = 0; i < r.snapshotLength; i++) {
+        const e = r.snapshotItem(i);
+        if (isVisible(e)) visible.push(e);
+    }
+    for (const text of texts) {
+        const e = visible.find(v => v.innerText.includes(text));
+        if (e) return [e, text];
+    }
+}
+return null;
+"""
+
+# Extracts the raw ID, date and item-count text for each order element passed in
+ORDER_FIELDS_JS = """
+const textOf = e => e ? e.innerText.trim() : null;
+const spanWith = (root, text) => Array.from(root.querySelectorAll('span')).find(s => s.textContent.includes(text));
+return arguments[0].map(root => {
+    const classed = root.querySelectorAll('span._2tnFgQdq');
+    const idEl = Array.from(root.querySelectorAll('span.VlINftPl')).find(s => s.textContent.includes('PO-'))
+        || spanWith(root, 'PO-') || root.querySelector('._2tnFgQdq');
+    const label = spanWith(root, 'Order Time:');
+    const dateEl = root.querySelector('span.VlINftPl > span') || classed[1]
+        || (label ? label.nextElementSibling : null);
+    const itemsEl = spanWith(root, 'items:') || classed[0];
+    return {id_text: textOf(idEl), date_str: textOf(dateEl), items_text: textOf(itemsEl)};
+});
+"""
+
+SCROLL_AND_CLICK_JS = "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'}); arguments[0].click();"
+
+# Resolves once an XPath reaches the wanted state ('present', 'visible' or 'gone'), or false on timeout
+WAIT_FOR_XPATH_JS = """
+const [xpath, state, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const isVisible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+const check = () => {
+    const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (state === 'gone') return !node || !isVisible(node);
+    if (state === 'visible') return !!node && isVisible(node);
+    return !!node;
+};
+if (check()) return done(true);
+const observer = new MutationObserver(() => {
+    if (check()) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+const timer = setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
+"""
+
+
+# Resolves with the first of the given texts to appear in the page, or null on timeout
+WAIT_FOR_TEXT_JS = """
+const [texts, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const match = () => {
+    const body = document.body ? document.body.innerText : '';
+    return texts.find(t => body.includes(t)) || null;
+};
+const found = match();
+if (found) return done(found);
+const observer = new MutationObserver(() => {
+    const text = match();
+    if (text) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(text);
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+const timer = setTimeout(() => { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
+# Clicks 'View more' until it disappears; each click waits for new order cards and no 'Loading' text.
+# An incomplete result gives its reason: 'cap' (click limit hit), 'timeout' or 'error'.
+LOAD_ALL_ORDERS_JS = """
+const [buttonXpath, loadingXpath, cardXpath, maxClicks, readyMs, loadMs] = arguments;
+const done = arguments[arguments.length - 1];
+const first = x => document.evaluate(x, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const count = x => document.evaluate(x, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+const waitFor = (check, timeoutMs) => new Promise(resolve => {
+    if (check()) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (check()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    const timer = setTimeout(() => { observer.disconnect(); resolve(false); }, timeoutMs);
+});
+let clicks = 0;
+(async () => {
+    await waitFor(() => first(buttonXpath + ' | ' + cardXpath), readyMs);
+    for (; clicks < maxClicks; clicks++) {
+        const button = first(buttonXpath);
+        if (!button) return done({clicks, complete: true, reason: null});
+        const before = count(cardXpath);
+        button.click();
+        const loaded = await waitFor(
+            () => !first(loadingXpath) && (count(cardXpath) > before || !first(buttonXpath)), loadMs
+        );
+        if (!loaded) return done({clicks: clicks + 1, complete: false, reason: 'timeout'});
+        await new Promise(resolve => setTimeout(resolve, 300 + Math.random() * 500));
+    }
+    const complete = !first(buttonXpath);
+    done({clicks, complete, reason: complete ? null : 'cap'});
+})().catch(e => done({clicks, complete: false, reason: 'error', error: String(e)}));
+"""
+
+# Resolves once the document has loaded and no finite animation is running, or false on timeout
+DOM_IDLE_JS = """
+const timeoutMs = arguments[0];
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + timeoutMs;
+const frame = () => new Promise(resolve => { requestAnimationFrame(() => resolve()); setTimeout(resolve, 100); });
+const animating = () => document.getAnimations().some(a =>
+    a.playState === 'running' && a.effect && a.effect.getTiming().iterations !== Infinity);
+(async () => {
+    while (Date.now() < deadline) {
+        if (document.readyState === 'complete' && !animating()) {
+            await frame();
+            await frame();
+            if (!animating()) return done(true);
+        }
+        await new Promise(resolve => setTimeout(resolve, 50));
+    }
+    done(false);
+})().catch(() => done(false));
+"""
+
+
+def find_first(driver, strategies, visible=False):
+    """Return the first element matched by any strategy using a single browser round-trip."""
+    js_strategies = []
+    for by, selector in strategies:
+        if by == By.CSS_SELECTOR:
+            js_strategies.append(['css', selector])
+        elif by == By.CLASS_NAME:
+            js_strategies.append(['css', f".{selector}"])
+        else:
+            js_strategies.append(['xpath', selector])
+    return driver.execute_script(FIND_FIRST_JS, js_strategies, visible)
+
+
+def xpath_contains_any(texts, target='.'):
+    """Build an XPath predicate matching when target contains any of the texts."""
+    return " or ".join(f"contains({target}, '{text}')" for text in texts)
+
+
+def wait_for_first(driver, strategies, timeout, visible=False):
+    """Wait until any strategy matches, returning the element or None on timeout."""
+    try:
+        return WebDriverWait(driver, timeout).until(
+            lambda d: find_first(d, strategies, visible)
+        )
+    except TimeoutException:
+        return None
+
+
+def wait_for_xpath(driver, xpath, timeout, state='present'):
+    """Wait in the browser for an XPath to become present, visible or gone.
+    
+    A MutationObserver resolves the wait on the first DOM change that satisfies it,
+    instead of polling over the WebDriver wire. If the page navigates mid-wait the
+    observer is lost, so this falls back to a regular WebDriverWait.
+    """
+    try:
+        driver.set_script_timeout(timeout + 5)
+        return bool(driver.execute_async_script(
+            WAIT_FOR_XPATH_JS, xpath, state, int(timeout * 1000)
+        ))
+    except ScriptTimeoutException:
+        # The script already used up the wait; don't start a second one
+        return False
+    except JavascriptException:
+        conditions = {
+            'present': EC.presence_of_element_located,
+            'visible': EC.visibility_of_element_located,
+            'gone': EC.invisibility_of_element_located
+        }
+        try:
+            WebDriverWait(driver, timeout).until(conditions[state]((By.XPATH, xpath)))
+            return True
+        except TimeoutException:
+            return False
+
+
+def wait_for_dom_idle(driver, timeout=10):
+    """Wait until the page has finished loading and settled its animations.
+    
+    Replaces fixed sleeps after clicks and navigation; falls back to waiting on
+    document.readyState if the page navigates mid-wait.
+    """
+    try:
+        driver.set_script_timeout(timeout + 5)
+        return bool(driver.execute_async_script(DOM_IDLE_JS, int(timeout * 1000)))
+    except ScriptTimeoutException:
+        return False
+    except JavascriptException:
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState;") == 'complete'
+            )
+            return True
+        except TimeoutException:
+            return False
+
+
+def wait_for_text(driver, texts, timeout):
+    """Wait for any of the texts to appear on the page and return the first one seen, or None.
+    
+    Falls back to polling the body text if the page navigates mid-wait.
+    """
+    try:
+        driver.set_script_timeout(timeout + 5)
+        return driver.execute_async_script(WAIT_FOR_TEXT_JS, texts, int(timeout * 1000))
+    except ScriptTimeoutException:
+        return None
+    except JavascriptException:
+        try:
+            return WebDriverWait(driver, timeout).until(
+                lambda d: next((t for t in texts if t in d.find_element(By.TAG_NAME, 'body').text), None)
+            )
+        except TimeoutException:
+            return None
+
 
 class CaptchaSolver:
     """Handles CAPTCHA solving operations."""
@@ -43,6 +350,7 @@ class CaptchaSolver:
     def __init__(self, verbose=False):
         self.api_key = os.getenv("CAPTCHA_API_KEY")
         self.verbose = verbose
+        self._solver = None
 
     def solve(self, driver):
         """Attempt to solve CAPTCHA automatically or prompt for manual intervention."""
@@ -52,9 +360,11 @@ class CaptchaSolver:
             time.sleep(wait_time)
             logger.info("Attempting to solve CAPTCHA")
             
-            from temu_captcha_solver.launcher import make_undetected_chromedriver_solver
-            solver = make_undetected_chromedriver_solver(api_key=self.api_key)
-            solver(driver)
+            # Build the solver on first use and reuse it for later CAPTCHAs
+            if self._solver is None:
+                from temu_captcha_solver.launcher import make_undetected_chromedriver_solver
+                self._solver = make_undetected_chromedriver_solver(api_key=self.api_key)
+            self._solver(driver)
             
             logger.info("CAPTCHA solved successfully")
             return True
@@ -62,7 +372,7 @@ class CaptchaSolver:
         except Exception as e:
             logger.error(f"CAPTCHA solving failed: {str(e)}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             
             logger.warning("Waiting 60s for manual intervention...")
             print(f"\n{'=' * 80}")
@@ -88,56 +398,71 @@ class CaptchaSolver:
 class Scheduler:
     """Manages bot execution scheduling based on historical success data."""
     
-    def __init__(self, state_file="scheduler_state.json"):
+    def __init__(self, state_file="scheduler_state.json", save_every=10):
         self.state_file = state_file
-        self.success_data = self.load_state()
-        self.model = LinearRegression()
+        self.binary_state_file = os.path.splitext(state_file)[0] + ".npz"
+        self.save_every = save_every
+        self._pending_updates = 0
+        self._timestamps, self._hours = self.load_state()
+        self._hour_counts = np.bincount(self._hours, minlength=24).astype(np.int64)
+        atexit.register(self.flush_state)
 
     def load_state(self):
-        """Load scheduler state from JSON file."""
+        """Load success timestamps (epoch seconds) and their local hours from disk."""
+        if os.path.exists(self.binary_state_file):
+            try:
+                with np.load(self.binary_state_file) as data:
+                    return data['timestamps'].astype(np.float64), data['hours'].astype(np.int64)
+            except Exception as e:
+                logger.warning(f"Could not load scheduler state: {str(e)}")
+                
+        # Migrate state written by older versions as JSON
         if os.path.exists(self.state_file):
             try:
                 with open(self.state_file, 'r') as f:
-                    return json.load(f)
+                    stamps = [datetime.fromisoformat(ts) for ts in json.load(f).get('timestamps', [])]
+                return (
+                    np.array([ts.timestamp() for ts in stamps], dtype=np.float64),
+                    np.array([ts.hour for ts in stamps], dtype=np.int64)
+                )
             except Exception:
-                return {"hours": {}, "timestamps": []}
-        return {"hours": {}, "timestamps": []}
+                pass
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
 
     def save_state(self):
         """Save current scheduler state to file."""
-        with open(self.state_file, 'w') as f:
-            json.dump(self.success_data, f, indent=2)
+        # Write beside the state file and swap it in, so a crash never leaves a truncated file
+        tmp_file = self.binary_state_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            np.savez(f, timestamps=self._timestamps, hours=self._hours)
+        os.replace(tmp_file, self.binary_state_file)
+        self._pending_updates = 0
+
+    def flush_state(self):
+        """Persist any updates not yet written to disk."""
+        if self._pending_updates:
+            self.save_state()
 
     def update_success(self, timestamp):
         """Update success metrics with new timestamp."""
         hour = timestamp.hour
-        hour_key = str(hour)
-        self.success_data['hours'][hour_key] = self.success_data['hours'].get(hour_key, 0) + 1
-        self.success_data['timestamps'].append(timestamp.isoformat())
-        self.save_state()
+        self._hour_counts[hour] += 1
+        self._timestamps = np.append(self._timestamps, timestamp.timestamp())
+        self._hours = np.append(self._hours, hour)
+        self._pending_updates += 1
+        if self._pending_updates >= self.save_every:
+            self.save_state()
 
     def get_next_run_time(self):
         """Calculate optimal next run time based on historical data."""
-        if not self.success_data['timestamps']:
+        if not len(self._timestamps):
             default_hour = random.randint(9, 17)
             return datetime.now().replace(
                 hour=default_hour, minute=0, second=0
             ) + timedelta(days=1)
 
-        try:
-            timestamps = [datetime.fromisoformat(ts) for ts in self.success_data['timestamps']]
-            X = np.array([ts.timestamp() for ts in timestamps]).reshape(-1, 1)
-            y = np.array([ts.hour for ts in timestamps])
-            
-            self.model.fit(X, y)
-            next_time = datetime.now() + timedelta(days=1)
-            predicted_hour = round(self.model.predict([[next_time.timestamp()]])[0] % 24)
-            predicted_hour = max(9, min(21, int(predicted_hour)))
-            
-        except Exception as e:
-            logger.error(f"Error in prediction model: {str(e)}")
-            best_hour = max(self.success_data['hours'].items(), key=lambda x: x[1])[0]
-            predicted_hour = int(best_hour)
+        # Run at the hour with the most recorded successes
+        predicted_hour = int(np.clip(self._hour_counts.argmax(), 9, 21))
 
         window_minutes = random.randint(-30, 30)
         next_run = datetime.now().replace(
@@ -155,9 +480,67 @@ class Scheduler:
 class TemuBot:
     """Main bot class for Temu price adjustment operations."""
     
-    def __init__(self):
+    # Dialog text indicators (multiple languages), each list joined into one pattern
+    _FAILURE_RE = re.compile("|".join([
+        r"sorry,? you cannot request",
+        r"not eligible for price adjustment",
+        r"exact same specifications",
+        r"same seller",
+        r"desculpe,? você não pode solicitar",
+        r"não é elegível para ajuste",
+        r"mesmas especificações",
+        r"mesmo vendedor",
+        r"items that are sold out",
+        r"discontinued",
+        r"out of stock",
+        r"no longer available",
+        r"refunded",
+        r"refund\/return"
+    ]), re.IGNORECASE)
+    
+    _SUCCESS_RE = re.compile("|".join([
+        r"request a price adjustment",
+        r"select refund method",
+        r"price adjustment",
+        r"refund amount",
+        r"reembolso",
+        r"ajuste de preço",
+        r"solicitar ajuste",
+        r"selecionar método"
+    ]), re.IGNORECASE)
+    
+    # Any of the confirmation messages shown after submitting a request
+    _CONFIRMATION_TEXTS = [
+        "Your refund is being processed",
+        "Reembolso está sendo processado",
+        "request has been submitted",
+        "solicitação foi enviada",
+        "successfully requested",
+        "solicitado com sucesso"
+    ]
+    
+    # Price adjustment button: text-anchored locators first, structural fallbacks second
+    _PRICE_ADJUSTMENT_TEXTS = ["Price adjustment", "Ajuste de preço"]
+    _PRICE_ADJUSTMENT_XPATHS = [
+        " | ".join(
+            f"//div[contains(@class, '_1TeP2qll') and contains(., '{text}')]"
+            f" | //div[contains(@class, '_2bQDCYwF') and contains(., '{text}')]"
+            f" | //div[@role='button' and .//span[contains(text(), '{text}')]]"
+            for text in _PRICE_ADJUSTMENT_TEXTS
+        ),
+        " | ".join([
+            "//div[contains(@class, 'adjustment') and contains(., 'Price')]",
+            "//div[contains(@data-uniqid, 'price-adjustment')]",
+            "//div[contains(@class, 'adjustment')]",
+            "//div[contains(@data-testid, 'price-adjustment')]",
+            "//div[contains(@data-role, 'price-adjustment')]",
+            "//div[contains(@id, 'priceAdjustmentBtn')]"
+        ])
+    ]
+    
+    def __init__(self, scheduler=None):
         self.logger = logger
-        self.scheduler = Scheduler()
+        self.scheduler = scheduler or Scheduler()
         self.captcha_solver = None
         self.driver = None
         self.stats = {
@@ -174,6 +557,13 @@ class TemuBot:
         }
         self.session_file = "session.json"
         self.verbose = False
+        self.headless = False
+        self.workers = 1
+        self._cookie_hash = None
+        self._on_orders_page = False
+        self._orders_by_id = None
+        # Shared with worker bots to guard stats, scheduler and order file updates
+        self._lock = threading.Lock()
 
     def init_driver(self, headless=False):
         """Initialize Chrome WebDriver with configurable options."""
@@ -192,15 +582,54 @@ class TemuBot:
             
         self.driver = webdriver.Chrome(options=options)
         
+        # All waits in this bot are explicit WebDriverWaits; an implicit wait would
+        # silently stretch every failed find_element inside them
+        self.driver.implicitly_wait(0)
+        self.widen_connection_pool()
+        
         if not headless:
             self.driver.maximize_window()
+            
+        self.block_heavy_resources()
+
+    def block_heavy_resources(self, enabled=True):
+        """Stop Chrome from downloading images, fonts and media the bot never reads.
+        
+        On from browser start; login lifts it before a CAPTCHA can appear, since
+        solving needs the puzzle images, and run restores it afterwards.
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": BLOCKED_URL_PATTERNS if enabled else []}
+            )
+        except Exception as e:
+            logger.warning(f"Could not block heavy resources: {str(e)}")
+
+    def widen_connection_pool(self, maxsize=DRIVER_POOL_SIZE):
+        """Let the driver keep more than one keep-alive connection to chromedriver."""
+        try:
+            pool_manager = self.driver.command_executor._conn
+            pool_manager.connection_pool_kw['maxsize'] = maxsize
+            # Drop the pool created for the session request so it is rebuilt with the new size
+            pool_manager.clear()
+        except Exception as e:
+            logger.warning(f"Could not resize WebDriver connection pool: {str(e)}")
 
     def save_session(self):
         """Save current browser session cookies to file."""
         try:
             cookies = self.driver.get_cookies()
+            serialized = json.dumps(cookies, sort_keys=True)
+            cookie_hash = hashlib.blake2b(serialized.encode()).digest()
+            if cookie_hash == self._cookie_hash:
+                logger.info("Session unchanged, skipping save")
+                return True
+                
             with open(self.session_file, 'w') as f:
-                json.dump(cookies, f)
+                f.write(serialized)
+            self._cookie_hash = cookie_hash
             logger.info("Session saved successfully")
             return True
         except Exception as e:
@@ -216,37 +645,51 @@ class TemuBot:
                 
             with open(self.session_file, 'r') as f:
                 cookies = json.load(f)
+            self._cookie_hash = hashlib.blake2b(
+                json.dumps(cookies, sort_keys=True).encode()
+            ).digest()
                 
+            # Cookies are set before navigating so temu.com only loads once
+            self.add_cookies(cookies)
             self.driver.get("https://www.temu.com")
-            for cookie in cookies:
-                if 'sameSite' in cookie and not isinstance(cookie['sameSite'], str):
-                    del cookie['sameSite']
-                self.driver.add_cookie(cookie)
-                
-            self.driver.get("https://www.temu.com")
-            random_delay(3, 5, "After loading cached session")
             
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located(
-                        (By.XPATH, "//div[text()='Orders & Account']")
-                    )
-                )
+            if wait_for_xpath(self.driver, ORDERS_ACCOUNT_XPATH, 15):
                 logger.info("Cached session is valid")
                 return True
-            except TimeoutException:
-                logger.warning("Cached session is invalid")
-                return False
+            logger.warning("Cached session is invalid")
+            return False
                 
         except Exception as e:
             logger.error(f"Failed to load cached session: {str(e)}")
             return False
 
+    def add_cookies(self, cookies):
+        """Add cookies with a single CDP call, falling back to one add_cookie per cookie."""
+        try:
+            self.driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [to_cdp_cookie(cookie) for cookie in cookies]}
+            )
+            return
+        except Exception as e:
+            logger.info(f"Bulk cookie restore unavailable, adding cookies one by one: {str(e)}")
+            
+        # WebDriver only accepts cookies for the domain currently loaded
+        if "temu.com" not in self.driver.current_url:
+            self.driver.get("https://www.temu.com")
+        for cookie in cookies:
+            if 'sameSite' in cookie and not isinstance(cookie['sameSite'], str):
+                del cookie['sameSite']
+            self.driver.add_cookie(cookie)
+
     def handle_privacy_banner(self):
         """Close privacy banner if present."""
         try:
-            random_delay(1, 3, "Before checking privacy banner")
-            
+            # Dismissal is remembered in localStorage, so later logins skip the probe
+            if self.driver.execute_script("return localStorage.getItem('banner_dismissed') === '1';"):
+                logger.info("Privacy banner already dismissed")
+                return True
+                
             # Banner detection strategies
             banner_strategies = [
                 (By.XPATH, "//div[contains(@class, '_1ay60Jd-')]"),
@@ -260,21 +703,13 @@ class TemuBot:
                 (By.XPATH, "//div[@role='dialog' and contains(@aria-label, 'privacy')]")
             ]
             
-            banner = None
-            for strategy in banner_strategies:
-                try:
-                    banner = WebDriverWait(self.driver, 5).until(
-                        EC.visibility_of_element_located(strategy)
-                    )
-                    logger.info("Privacy banner found")
-                    break
-                except TimeoutException:
-                    continue
-                    
+            banner = wait_for_first(self.driver, banner_strategies, 5, visible=True)
             if not banner:
                 logger.info("No privacy banner found")
                 return False
                 
+            logger.info("Privacy banner found")
+                
             logger.info("Attempting to close privacy banner")
             
             # Accept button strategies
@@ -290,32 +725,13 @@ class TemuBot:
                 (By.XPATH, "//div[contains(@class, 'privacy-button-accept')]")
             ]
             
-            accept_btn = None
-            for strategy in accept_btn_strategies:
-                try:
-                    accept_btn = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable(strategy)
-                    )
-                    logger.info("Found Accept All button")
-                    break
-                except TimeoutException:
-                    continue
-                    
+            accept_btn = wait_for_first(self.driver, accept_btn_strategies, 5, visible=True)
             if accept_btn:
-                random_delay(0.5, 1.5, "Before clicking Accept All")
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
-                    accept_btn
-                )
-                random_delay(0.5, 1.5, "Scrolling to Accept All button")
-                
-                try:
-                    accept_btn.click()
-                except Exception:
-                    self.driver.execute_script("arguments[0].click();", accept_btn)
-                    
+                logger.info("Found Accept All button")
+                random_delay(0.1, 0.4, "Before clicking Accept All")
+                self.driver.execute_script(SCROLL_AND_CLICK_JS, accept_btn)
                 logger.info("Clicked 'Accept All' on privacy banner")
-                random_delay(1, 3, "After closing privacy banner")
+                self.mark_banner_dismissed()
                 return True
                 
             # Fallback to ESC key
@@ -323,6 +739,7 @@ class TemuBot:
                 actions = ActionChains(self.driver)
                 actions.send_keys(Keys.ESCAPE).perform()
                 logger.info("Pressed ESC to close privacy banner")
+                self.mark_banner_dismissed()
                 return True
             except Exception:
                 logger.warning("Could not close privacy banner")
@@ -331,39 +748,46 @@ class TemuBot:
         except Exception as e:
             logger.warning(f"Failed to handle privacy banner: {str(e)}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             return False
 
+    def mark_banner_dismissed(self):
+        """Remember the banner dismissal for this origin."""
+        try:
+            self.driver.execute_script("localStorage.setItem('banner_dismissed', '1');")
+        except Exception as e:
+            logger.warning(f"Could not store banner state: {str(e)}")
+
     def login(self):
         """Perform login sequence with fallback strategies."""
         try:
             logger.info("Navigating to login page")
             self.driver.get("https://www.temu.com/login.html")
-            random_delay(2, 4, "Page load")
             self.handle_privacy_banner()
             
             if self.load_cached_session():
                 logger.info("Logged in using cached session")
                 return True
                 
+            # Credential login can end in a CAPTCHA, which needs its images
+            self.block_heavy_resources(enabled=False)
+            
             try:
                 email_field = WebDriverWait(self.driver, 30).until(
                     EC.visibility_of_element_located(
                         (By.XPATH, "//input[@aria-label='Email or phone number']")
                     )
                 )
-                random_delay(0.5, 1.5, "Before typing email")
+                random_delay(0.1, 0.4, "Before typing email")
                 email_field.send_keys(os.getenv("TEMU_EMAIL"))
-                random_delay(1, 2, "Typing email")
                 
                 continue_btn = WebDriverWait(self.driver, 30).until(
                     EC.element_to_be_clickable(
                         (By.XPATH, "//button[@id='submit-button']")
                     )
                 )
-                random_delay(0.5, 1.5, "Before clicking Continue")
+                random_delay(0.1, 0.4, "Before clicking Continue")
                 continue_btn.click()
-                random_delay(3, 5, "After clicking Continue")
                 
             except TimeoutException:
                 logger.warning("Email field not found, proceeding directly to password/captcha")
@@ -377,86 +801,68 @@ class TemuBot:
                     (By.XPATH, "//input[@aria-label='Password']")
                 )
             )
-            random_delay(0.5, 1.5, "Before typing password")
+            random_delay(0.1, 0.4, "Before typing password")
             password_field.send_keys(os.getenv("TEMU_PASSWORD"))
-            random_delay(1, 2, "Typing password")
             
             submit_btn = WebDriverWait(self.driver, 30).until(
                 EC.element_to_be_clickable(
                     (By.XPATH, "//button[@id='submit-button']")
                 )
             )
-            random_delay(0.5, 1.5, "Before clicking Sign In")
+            random_delay(0.1, 0.4, "Before clicking Sign In")
             submit_btn.click()
-            random_delay(3, 5, "After clicking Sign In")
             
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//div[text()='Orders & Account']")
-                )
-            )
+            if not wait_for_xpath(self.driver, ORDERS_ACCOUNT_XPATH, 30):
+                raise TimeoutException("'Orders & Account' not found after signing in")
             self.save_session()
             return True
             
         except Exception as e:
             logger.error(f"Login failed: {str(e)}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             return False
 
     def navigate_to_orders(self):
         """Navigate to orders management page."""
         try:
             logger.info("Navigating to orders page")
-            orders_btn = WebDriverWait(self.driver, 30).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//div[text()='Orders & Account']")
-                )
-            )
-            random_delay(0.5, 1.5, "Before clicking Orders & Account")
+            if not wait_for_xpath(self.driver, ORDERS_ACCOUNT_XPATH, 30, state='visible'):
+                raise TimeoutException("'Orders & Account' button not found")
+            orders_btn = self.driver.find_element(By.XPATH, ORDERS_ACCOUNT_XPATH)
+            random_delay(0.1, 0.4, "Before clicking Orders & Account")
             orders_btn.click()
             
             WebDriverWait(self.driver, 30).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//div[contains(@class, '_2DCuXnC8')]")
+                    (By.CSS_SELECTOR, "div._2DCuXnC8")
                 )
             )
-            random_delay(2, 4, "Orders page load")
+            self._on_orders_page = True
             return True
             
         except Exception as e:
             logger.error(f"Navigation to orders failed: {str(e)}")
             return False
 
-    def is_view_more_present(self):
-        """Check if 'View more' button is present."""
+    def load_all_orders(self, max_clicks=20):
+        """Click 'View more' until every order is listed, in one browser-side loop."""
         try:
-            return WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//span[contains(text(),'View more')]/parent::div[@role='button']")
-                )
-            ) is not None
-        except TimeoutException:
-            return False
-
-    def click_view_more(self):
-        """Click the 'View more' button to load additional orders."""
-        try:
-            view_more_btn = WebDriverWait(self.driver, 20).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//span[contains(text(),'View more')]/parent::div[@role='button']")
-                )
+            self.driver.set_script_timeout(10 + max_clicks * 31)
+            result = self.driver.execute_async_script(
+                LOAD_ALL_ORDERS_JS,
+                VIEW_MORE_XPATH, LOADING_XPATH, ORDER_CARD_XPATH,
+                max_clicks, 10000, 30000
             )
-            random_delay(0.5, 1.5, "Before clicking View More")
-            view_more_btn.click()
-            
-            WebDriverWait(self.driver, 30).until(
-                EC.invisibility_of_element_located(
-                    (By.XPATH, "//span[contains(text(),'Loading')]")
-                )
-            )
-            random_delay(3, 5, "After clicking View More")
-            return True
+            logger.info(f"Clicked 'View more' {result['clicks']} times")
+            reason = result.get('reason')
+            if reason == 'cap':
+                logger.warning(f"Stopped after {max_clicks} 'View more' clicks with more orders left")
+            elif reason == 'timeout':
+                logger.warning("Orders were still loading after 30 seconds")
+            elif reason == 'error':
+                logger.error(f"Loading more orders failed in the page: {result.get('error')}")
+            return result['complete']
             
         except Exception as e:
             logger.error(f"Failed to click 'View more': {str(e)}")
@@ -465,22 +871,18 @@ class TemuBot:
     def get_order_elements(self):
         """Locate order elements using multiple strategies."""
         strategies = [
-            (By.XPATH, "//div[contains(@class, '_2DCuXnC8') and @data-uniqid]"),
+            (By.XPATH, ORDER_CARD_XPATH),
             (By.XPATH, "//span[contains(text(),'PO-')]/ancestor::div[contains(@class, '_2DCuXnC8')]"),
             (By.XPATH, "//span[normalize-space()='View order details']/ancestor::div[contains(@class, '_2DCuXnC8')]")
         ]
         
-        for i, strategy in enumerate(strategies, 1):
-            try:
-                elements = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_all_elements_located(strategy)
-                )
+        # One wait covers every strategy, so a missing first layout no longer costs 10s per fallback
+        if wait_for_xpath(self.driver, " | ".join(xpath for _, xpath in strategies), 10):
+            for i, strategy in enumerate(strategies, 1):
+                elements = self.driver.find_elements(*strategy)
                 if elements:
                     logger.info(f"Found {len(elements)} orders using strategy {i}")
                     return elements
-            except TimeoutException:
-                logger.info(f"Strategy {i} failed, trying next")
-                continue
                 
         logger.warning("No orders found using any strategy")
         return []
@@ -491,37 +893,27 @@ class TemuBot:
             orders = []
             order_elements = self.get_order_elements()
             
-            for element in order_elements:
+            if not order_elements:
+                return orders
+                
+            # Read every order's fields in one round-trip instead of several find_element calls per field
+            fields = self.driver.execute_script(ORDER_FIELDS_JS, order_elements)
+            
+            for element, data in zip(order_elements, fields):
                 try:
                     # Extract order ID
-                    order_id_element = self.safe_find_element(
-                        element,
-                        (By.XPATH, ".//span[contains(@class, 'VlINftPl') and contains(., 'PO-')]"),
-                        (By.XPATH, ".//span[contains(text(),'PO-')]"),
-                        (By.CLASS_NAME, "_2tnFgQdq")
-                    )
-                    order_id_text = order_id_element.text.strip()
-                    order_id_match = re.search(r'PO-[\w-]+', order_id_text)
+                    if not data['id_text']:
+                        raise NoSuchElementException("Order ID element not found")
+                    order_id_match = _PO_RE.search(data['id_text'])
                     order_id = order_id_match.group(0) if order_id_match else "N/A"
                     
                     # Extract order date
-                    date_element = self.safe_find_element(
-                        element,
-                        (By.XPATH, ".//span[contains(@class, 'VlINftPl')]/span"),
-                        (By.XPATH, ".//span[contains(@class, '_2tnFgQdq')][2]"),
-                        (By.XPATH, ".//span[contains(text(),'Order Time:')]/following-sibling::span")
-                    )
-                    date_str = date_element.text.strip() if date_element else "N/A"
+                    date_str = data['date_str'] or "N/A"
                     order_date = parse_order_date(date_str)
                     
                     # Extract item count
-                    items_element = self.safe_find_element(
-                        element,
-                        (By.XPATH, ".//span[contains(text(),'items:')]"),
-                        (By.XPATH, ".//span[contains(@class, '_2tnFgQdq')][1]")
-                    )
-                    items_text = items_element.text.strip() if items_element else "N/A"
-                    items_match = re.search(r'(\d+)\s+items?', items_text)
+                    items_text = data['items_text'] or "N/A"
+                    items_match = _ITEMS_RE.search(items_text)
                     item_count = items_match.group(1) if items_match else "N/A"
                     
                     orders.append({
@@ -529,41 +921,42 @@ class TemuBot:
                         'date_str': date_str,
                         'date_obj': order_date,
                         'item_count': item_count,
-                        'valid': validate_order_date(order_date) if order_date else False,
+                        'valid': False,
                         'element': element
                     })
                     
                 except Exception as e:
                     logger.warning(f"Error processing order element: {str(e)}")
                     
+            # Check the 30-day window for all orders at once; unparsed dates become NaN and fail
+            if orders:
+                timestamps = np.array([
+                    order['date_obj'].timestamp() if order['date_obj'] else np.nan
+                    for order in orders
+                ])
+                valid_mask = timestamps >= time.time() - 30 * 86400
+                for order, valid in zip(orders, valid_mask):
+                    order['valid'] = bool(valid)
+                    
             return orders
             
         except Exception as e:
             logger.error(f"Failed to get orders: {str(e)}")
             return []
 
-    def safe_find_element(self, parent, *strategies):
-        """Find element using multiple strategies with fallback."""
-        for strategy in strategies:
-            try:
-                return parent.find_element(*strategy)
-            except Exception:
-                continue
-        raise NoSuchElementException(f"Element not found using strategies: {strategies}")
-
     def get_order_details_page(self, order_id):
         """Navigate to specific order details page."""
         try:
             logger.info(f"Navigating to order details: {order_id}")
             order_url = f"https://www.temu.com/bgt_order_detail.html?parent_order_sn={order_id}"
+            self._on_orders_page = False
             self.driver.get(order_url)
             
             WebDriverWait(self.driver, 30).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//div[@class='_3ofg55P_']")
+                    (By.CSS_SELECTOR, "div[class='_3ofg55P_']")
                 )
             )
-            long_random_delay(3, 15, "Order details page load")
             return True
             
         except Exception as e:
@@ -595,48 +988,46 @@ class TemuBot:
             (By.CLASS_NAME, "track-button")
         ]
         
-        track_btn = None
-        for strategy in track_btn_strategies:
-            try:
-                track_btn = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable(strategy))
-                break
-            except Exception:
-                continue
-                
+        track_btn = wait_for_first(self.driver, track_btn_strategies, 10, visible=True)
         if not track_btn:
             raise NoSuchElementException("Track button not found")
             
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
+        # Open tracking in its own tab when the button links somewhere, so the
+        # order details page stays loaded and needs no back navigation
+        original_window = self.driver.current_window_handle
+        track_url = self.driver.execute_script(
+            "const link = arguments[0].closest('a'); return link ? link.href : null;",
             track_btn
         )
-        random_delay(0.5, 1.5, "Scrolling to Track button")
-        self.driver.execute_script("arguments[0].click();", track_btn)
-        long_random_delay(3, 15, "After clicking Track")
-        
-        WebDriverWait(self.driver, 30).until(
-            EC.presence_of_element_located(
-                (By.CLASS_NAME, "trackingInfoWrap-1NRtF"))
-            )
-        long_random_delay(3, 15, "Tracking page load")
-        
-        # Extract tracking number
-        tracking_number = "N/A"
-        tracking_strategies = [
-            (By.XPATH, "//div[contains(@class, 'serviceProviderNumber-VPeGz')]"),
-            (By.CLASS_NAME, "serviceProviderNumber-VPeGz"),
-            (By.XPATH, "//div[contains(text(), 'Tracking Number:')]/following-sibling::div"),
-            (By.XPATH, "//div[contains(text(), 'Tracking Number:')]"),
-            (By.CSS_SELECTOR, ".trackingInfo-zPYF_"),
-            (By.XPATH, "//div[@class='trackingInfo-zPYF_']"),
-            (By.XPATH, "//div[contains(@class, 'tracking-number')]")
-        ]
         
-        for strategy in tracking_strategies:
-            try:
-                element = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located(strategy))
+        if track_url:
+            self.driver.switch_to.new_window('tab')
+            # CDP network settings are per tab, so the new tab needs its own block
+            self.block_heavy_resources()
+            self.driver.get(track_url)
+        else:
+            self.driver.execute_script(SCROLL_AND_CLICK_JS, track_btn)
+            
+        try:
+            WebDriverWait(self.driver, 30).until(
+                EC.presence_of_element_located(
+                    (By.CLASS_NAME, "trackingInfoWrap-1NRtF"))
+                )
+            
+            # Extract tracking number
+            tracking_number = "N/A"
+            tracking_strategies = [
+                (By.XPATH, "//div[contains(@class, 'serviceProviderNumber-VPeGz')]"),
+                (By.CLASS_NAME, "serviceProviderNumber-VPeGz"),
+                (By.XPATH, "//div[contains(text(), 'Tracking Number:')]/following-sibling::div"),
+                (By.XPATH, "//div[contains(text(), 'Tracking Number:')]"),
+                (By.CSS_SELECTOR, ".trackingInfo-zPYF_"),
+                (By.XPATH, "//div[@class='trackingInfo-zPYF_']"),
+                (By.XPATH, "//div[contains(@class, 'tracking-number')]")
+            ]
+            
+            element = wait_for_first(self.driver, tracking_strategies, 10)
+            if element:
                 text = element.text
                 
                 if 'Tracking Number:' in text:
@@ -646,23 +1037,24 @@ class TemuBot:
                 else:
                     tracking_number = text
                     
-                tracking_number = re.sub(r'\s+', '', tracking_number)
-                break
-            except Exception:
-                continue
+                tracking_number = _WS_RE.sub('', tracking_number)
+                    
+            # Extract delivery information
+            delivery_text = self.get_element_text_or_default(
+                "//div[@class='deliveryInfoWrap-12bOU']",
+                By.XPATH,
+                default="N/A"
+            )
+        finally:
+            if track_url:
+                self.driver.close()
+                self.driver.switch_to.window(original_window)
                 
-        # Extract delivery information
-        delivery_text = self.get_element_text_or_default(
-            "//div[@class='deliveryInfoWrap-12bOU']",
-            By.XPATH,
-            default="N/A"
-        )
-        from utils import parse_delivery_date
+        if not track_url:
+            self.driver.back()
+            
         formatted_delivery = parse_delivery_date(delivery_text)
         
-        self.driver.back()
-        long_random_delay(3, 15, "After going back from tracking")
-        
         return {
             'tracking_number': tracking_number,
             'delivery_text': delivery_text,
@@ -686,9 +1078,7 @@ class TemuBot:
         """Main order processing workflow."""
         try:
             # Load all available orders
-            while self.is_view_more_present():
-                self.click_view_more()
-                long_random_delay(10, 20, "Loading more orders")
+            self.load_all_orders()
                 
             orders = self.get_orders()
             if not orders:
@@ -708,28 +1098,102 @@ class TemuBot:
             orders_to_process = valid_orders[:max_orders]
             logger.info(f"Processing {len(orders_to_process)} orders in this run")
             
-            for i, order in enumerate(orders_to_process, 1):
-                self.stats['processed'] += 1
-                logger.info(f"\n{'='*50}")
-                logger.info(f"Processing order {i}/{len(orders_to_process)}")
-                logger.info(f"Order ID: {order['id']}")
-                logger.info(f"Order date: {order['date_obj'].strftime('%d/%m/%Y') if order['date_obj'] else 'N/A'}")
-                logger.info(f"Item count: {order['item_count']}")
-                
-                if not self.process_order(order):
-                    logger.warning(f"Skipping order {order['id']}")
-                    
-                long_random_delay(15, 45, "Between order processing")
+            # One report timestamp for the whole batch
+            updated_at = datetime.now().strftime(UPDATED_AT_FORMAT)
+            if self.workers > 1 and len(orders_to_process) > 1:
+                self.process_orders_parallel(orders_to_process, updated_at)
+            else:
+                for i, order in enumerate(orders_to_process, 1):
+                    self._process_one(order, i, len(orders_to_process), updated_at)
                 
             return True
             
         except Exception as e:
             logger.error(f"Order processing failed: {str(e)}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             return False
 
-    def process_order(self, order):
+    def _process_one(self, order, index, total, updated_at=None):
+        """Process a single order from the batch and pause before the next one."""
+        self._increment_stat('processed')
+        logger.info(f"\n{'='*50}")
+        logger.info(f"Processing order {index}/{total}")
+        logger.info(f"Order ID: {order['id']}")
+        logger.info(f"Order date: {order['date_obj'].strftime('%d/%m/%Y') if order['date_obj'] else 'N/A'}")
+        logger.info(f"Item count: {order['item_count']}")
+        
+        if not self.process_order(order, updated_at):
+            logger.warning(f"Skipping order {order['id']}")
+            
+        # Nothing follows the last order, so there is no need to pace it
+        if index < total:
+            long_random_delay(15, 45, "Between order processing")
+
+    def _increment_stat(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def spawn_worker(self):
+        """Start an extra browser that reuses the saved session, or return None."""
+        worker = TemuBot(scheduler=self.scheduler)
+        worker.stats = self.stats
+        worker.verbose = self.verbose
+        worker._lock = self._lock
+        worker._orders_by_id = self._orders_by_id
+        try:
+            worker.init_driver(self.headless)
+            if worker.load_cached_session():
+                return worker
+        except Exception:
+            # Don't leave a half-started browser behind
+            worker.close()
+            raise
+        logger.warning("Worker browser could not reuse the session, skipping it")
+        worker.close()
+        return None
+
+    def process_orders_parallel(self, orders, updated_at=None):
+        """Process orders concurrently, one browser per worker."""
+        worker_count = min(self.workers, len(orders))
+        bots = [self]
+        futures = []
+        idle = queue.Queue()
+        
+        def run_order(item):
+            index, order = item
+            bot = idle.get()
+            try:
+                bot._process_one(order, index, len(orders), updated_at)
+            finally:
+                idle.put(bot)
+                
+        try:
+            # Start the extra browsers side by side rather than one after another
+            with ThreadPoolExecutor(max_workers=worker_count - 1) as executor:
+                futures = [executor.submit(self.spawn_worker) for _ in range(worker_count - 1)]
+            for future in futures:
+                try:
+                    worker = future.result()
+                except Exception as e:
+                    logger.warning(f"Worker browser failed to start: {str(e)}")
+                    continue
+                if worker:
+                    bots.append(worker)
+            logger.info(f"Processing orders with {len(bots)} browser(s)")
+            
+            for bot in bots:
+                idle.put(bot)
+                
+            with ThreadPoolExecutor(max_workers=len(bots)) as executor:
+                list(executor.map(run_order, enumerate(orders, 1)))
+        finally:
+            # Quit every worker that started, even if setup was cut short
+            for future in futures:
+                if not future.cancelled() and future.exception() is None and future.result():
+                    future.result().close()
+
+    def process_order(self, order, updated_at=None):
         """Process individual order for price adjustment with enhanced verification"""
         order['attempts'] = 0
         max_attempts = 5
@@ -768,32 +1232,34 @@ class TemuBot:
                 adjustment_result = self.attempt_price_adjustment(order)
                 
                 if adjustment_result is True:
-                    self.stats['success'] += 1
-                    self.scheduler.update_success(datetime.now())
+                    self._increment_stat('success')
+                    with self._lock:
+                        self.scheduler.update_success(datetime.now())
                     order['adjustment_status'] = 'success'
                     order['adjustment_success'] = True
                     result = True
                 elif adjustment_result is False:
-                    self.stats['adjustment_not_available'] += 1
+                    self._increment_stat('adjustment_not_available')
                     order['adjustment_status'] = 'not_available'
                     result = False
                 else:
-                    self.stats['failures'] += 1
+                    self._increment_stat('failures')
                     order['adjustment_status'] = 'failed'
                     order['last_error'] = 'Price adjustment failed'
                     
                 order['adjustment_attempted'] = True
-                save_order_data(order)
-                save_order_to_txt(order)
-                
-                self.navigate_to_orders_page()
+                with self._lock:
+                    save_order_data(order, self._orders_by_id)
+                    save_order_to_txt(order, updated_at=updated_at)
+                    
+                # No trip back to the orders list: the next order opens its details page by URL
                 
             except Exception as e:
                 logger.error(f"Error processing order: {str(e)}")
                 if self.verbose:
-                    logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                    logger.verbose("Stacktrace", exc_info=True)
                     
-                self.stats['failures'] += 1
+                self._increment_stat('failures')
                 self.save_page_source(f"order_{order['id']}")
                 order['last_error'] = str(e)
                 order['adjustment_status'] = 'failed'
@@ -812,18 +1278,34 @@ class TemuBot:
     def navigate_to_orders_page(self):
         """Return to main orders page."""
         try:
-            self.driver.get("https://www.temu.com/bgt_order.html")
+            if self._on_orders_page and self.driver.execute_script(
+                "return !!document.querySelector('div._2DCuXnC8');"
+            ):
+                return True
+                
+            self.navigate_without_load_wait("https://www.temu.com/bgt_order.html")
             WebDriverWait(self.driver, 30).until(
                 EC.presence_of_element_located(
-                    (By.XPATH, "//div[contains(@class, '_2DCuXnC8')]")
+                    (By.CSS_SELECTOR, "div._2DCuXnC8")
                 )
             )
-            long_random_delay(3, 15, "Navigating back to orders page")
+            self._on_orders_page = True
             return True
         except Exception as e:
             logger.error(f"Failed to navigate to orders page: {str(e)}")
             return False
 
+    def navigate_without_load_wait(self, url):
+        """Start a navigation over CDP without blocking on the page load event.
+        
+        Callers wait for the element they need instead, so slow third-party
+        requests at the tail of the load no longer hold them up.
+        """
+        try:
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        except WebDriverException:
+            self.driver.get(url)
+
     def check_dialog_type(self):
         """Check the type of the dialog that appears after clicking price adjustment.
         Returns:
@@ -834,53 +1316,20 @@ class TemuBot:
         try:
             # Get the dialog element
             dialog = WebDriverWait(self.driver, 5).until(
-                EC.visibility_of_element_located((By.XPATH, "//div[@role='dialog']"))
+                EC.visibility_of_element_located((By.CSS_SELECTOR, "div[role='dialog']"))
             )
+            # Let the dialog finish rendering before its text is classified
+            wait_for_dom_idle(self.driver)
             dialog_text = dialog.text.lower()
             logger.info(f"Dialog text: {dialog_text[:200]}...")
 
-            # Adicionar pausa de 5-10 segundos antes de verificar o tipo
-            long_random_delay(5, 10, "After dialog appears")
-
-            # Failure indicators (multiple languages)
-            failure_indicators = [
-                r"sorry,? you cannot request",
-                r"not eligible for price adjustment",
-                r"exact same specifications",
-                r"same seller",
-                r"desculpe,? você não pode solicitar",
-                r"não é elegível para ajuste",
-                r"mesmas especificações",
-                r"mesmo vendedor",
-                r"items that are sold out",
-                r"discontinued",
-                r"out of stock",
-                r"no longer available",
-                r"refunded",
-                r"refund\/return"
-            ]
-
-            for indicator in failure_indicators:
-                if re.search(indicator, dialog_text, re.IGNORECASE):
-                    logger.info("Failure dialog detected")
-                    return 'failure'
-
-            # Success indicators (multiple languages)
-            success_indicators = [
-                r"request a price adjustment",
-                r"select refund method",
-                r"price adjustment",
-                r"refund amount",
-                r"reembolso",
-                r"ajuste de preço",
-                r"solicitar ajuste",
-                r"selecionar método"
-            ]
+            if self._FAILURE_RE.search(dialog_text):
+                logger.info("Failure dialog detected")
+                return 'failure'
 
-            for indicator in success_indicators:
-                if re.search(indicator, dialog_text, re.IGNORECASE):
-                    logger.info("Success dialog detected")
-                    return 'success'
+            if self._SUCCESS_RE.search(dialog_text):
+                logger.info("Success dialog detected")
+                return 'success'
 
             # Class-based indicators as fallback
             class_indicators = [
@@ -903,65 +1352,57 @@ class TemuBot:
             logger.error(f"Error checking dialog type: {str(e)}")
             return 'unknown'
 
+    def _pick_visible_containing(self, xpath, texts):
+        """Return the first visible element and text, trying texts in priority order.
+        
+        xpath may also be a list of XPaths, tried in order within the same call.
+        """
+        match = self.driver.execute_script(PICK_VISIBLE_CONTAINING_JS, xpath, texts)
+        return match if match else (None, None)
+
+    def find_price_adjustment_button(self):
+        """Return the visible price adjustment button, or None."""
+        # Every locator group is tried inside one browser call
+        try:
+            button, text = self._pick_visible_containing(
+                self._PRICE_ADJUSTMENT_XPATHS, self._PRICE_ADJUSTMENT_TEXTS
+            )
+        except WebDriverException:
+            return None
+        if button:
+            logger.info(f"Found valid button with text: {text}")
+        return button
+
     def attempt_price_adjustment(self, order):
         """Attempt to initiate price adjustment with enhanced button detection"""
         try:
             logger.info("Attempting price adjustment")
             
-            # Button location strategies - enhanced detection
-            strategies = [
-                # Exact text match
-                (By.XPATH, "//div[contains(@class, '_1TeP2qll') and contains(., 'Price adjustment')]"),
-                (By.XPATH, "//div[contains(@class, '_2bQDCYwF') and contains(., 'Price adjustment')]"),
-                (By.XPATH, "//div[@role='button' and .//span[contains(text(), 'Price adjustment')]]"),
-                
-                # Portuguese version
-                (By.XPATH, "//div[contains(@class, '_1TeP2qll') and contains(., 'Ajuste de preço')]"),
-                (By.XPATH, "//div[contains(@class, '_2bQDCYwF') and contains(., 'Ajuste de preço')]"),
-                (By.XPATH, "//div[@role='button' and .//span[contains(text(), 'Ajuste de preço')]]"),
-                
-                # Fallback strategies
-                (By.XPATH, "//div[contains(@class, 'adjustment') and contains(., 'Price')]"),
-                (By.XPATH, "//div[contains(@data-uniqid, 'price-adjustment')]"),
-                (By.CSS_SELECTOR, "div[class*='adjustment']"),
-                (By.XPATH, "//div[contains(@data-testid, 'price-adjustment')]"),
-                (By.XPATH, "//div[contains(@data-role, 'price-adjustment')]"),
-                (By.XPATH, "//div[contains(@id, 'priceAdjustmentBtn')]")
-            ]
-            
             max_attempts = 7
+            unknown_dialogs = 0
             for attempt in range(1, max_attempts + 1):
                 logger.info(f"Price adjustment attempt {attempt}/{max_attempts}")
-                price_adj_btn = None
                 
-                for strategy in strategies:
-                    try:
-                        elements = self.driver.find_elements(strategy[0], strategy[1])
-                        for element in elements:
-                            if element.is_displayed() and ("Price adjustment" in element.text or "Ajuste de preço" in element.text):
-                                price_adj_btn = element
-                                logger.info(f"Found valid button using strategy: {strategy}")
-                                break
-                        if price_adj_btn:
-                            break
-                    except Exception:
-                        continue
-                        
+                # Poll for the button, allowing longer on each attempt (2s, 4s, ... up to 16s)
+                timeout = min(2 ** attempt, 16)
+                try:
+                    price_adj_btn = WebDriverWait(self.driver, timeout).until(
+                        lambda d: self.find_price_adjustment_button()
+                    )
+                except TimeoutException:
+                    price_adj_btn = None
+                    
                 if not price_adj_btn:
                     logger.error(f"Price adjustment button not found on attempt {attempt}")
                     if attempt == max_attempts:
                         return None
                         
-                    # Try scrolling to trigger lazy loading
+                    # Try scrolling to trigger lazy loading; reload only once that keeps failing
                     self.driver.execute_script("window.scrollBy(0, 500);")
-                    long_random_delay(3, 5, "Scrolling to find button")
-                    self.driver.refresh()
-                    long_random_delay(5, 10, "Page refresh")
-                    continue
-                    
-                # Double verification
-                if "Price adjustment" not in price_adj_btn.text and "Ajuste de preço" not in price_adj_btn.text:
-                    logger.warning("Button text verification failed, trying next strategy")
+                    if attempt >= 5:
+                        self.driver.refresh()
+                        wait_for_dom_idle(self.driver)
+                        random_delay(0.3, 0.8, "After page refresh")
                     continue
                     
                 # Scroll to button with smooth behavior
@@ -969,24 +1410,24 @@ class TemuBot:
                     "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
                     price_adj_btn
                 )
-                long_random_delay(1, 3, "After scrolling to button")
+                wait_for_dom_idle(self.driver)
+                random_delay(0.3, 0.8, "After scrolling to button")
                 
-                # Highlight button for visual confirmation
-                self.driver.execute_script(
-                    "arguments[0].style.border = '3px solid red';", 
-                    price_adj_btn
-                )
-                long_random_delay(0.5, 1, "Highlighting button")
-                
-                # Click using JavaScript to avoid interception
-                self.driver.execute_script("arguments[0].click();", price_adj_btn)
+                # Click using JavaScript to avoid interception, highlighting the button when debugging
+                if self.verbose:
+                    self.driver.execute_script(
+                        "arguments[0].style.border = '3px solid red'; arguments[0].click();", 
+                        price_adj_btn
+                    )
+                else:
+                    self.driver.execute_script("arguments[0].click();", price_adj_btn)
                 logger.info("Clicked price adjustment button")
                 
                 # Wait for the dialog to appear and check its type
                 try:
                     # Wait for any dialog to appear with increased timeout
                     WebDriverWait(self.driver, 15).until(
-                        EC.visibility_of_element_located((By.XPATH, "//div[@role='dialog']"))
+                        EC.visibility_of_element_located((By.CSS_SELECTOR, "div[role='dialog']"))
                     )
                     
                     # Check dialog content
@@ -1000,6 +1441,13 @@ class TemuBot:
                         return False
                     else:
                         logger.warning("Unknown dialog type after click")
+                        unknown_dialogs += 1
+                        if unknown_dialogs >= 2:
+                            # The same unrecognised dialog again; more clicks will not change it
+                            logger.error("Unknown dialog appeared twice in a row, giving up on this order")
+                            self.save_page_source(f"unknown_dialog_{order['id']}")
+                            return None
+                            
                         # Try to close the dialog and retry
                         try:
                             close_btn = self.driver.find_element(
@@ -1012,6 +1460,7 @@ class TemuBot:
                         continue
                 except TimeoutException:
                     logger.warning("Dialog did not appear after click")
+                    unknown_dialogs = 0
                     if attempt < max_attempts:
                         continue
                     else:
@@ -1023,7 +1472,7 @@ class TemuBot:
         except Exception as e:
             logger.error(f"Price adjustment failed: {str(e)}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             return None
 
     def handle_price_adjustment_flow(self, order):
@@ -1053,37 +1502,26 @@ class TemuBot:
                 "Solicitar reembolso"
             ]
             
-            for text in request_texts:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, f"//div[@role='button' and contains(., '{text}')]")
-                    for element in elements:
-                        if text in element.text and element.is_displayed():
-                            request_btn = element
-                            logger.info(f"Found request button with text: {text}")
-                            break
-                    if request_btn:
-                        break
-                except Exception:
-                    continue
+            request_btn, text = self._pick_visible_containing(
+                f"//div[@role='button' and ({xpath_contains_any(request_texts)})]", request_texts
+            )
+            if request_btn:
+                logger.info(f"Found request button with text: {text}")
             
             if not request_btn:
                 logger.error("Valid request button not found in adjustment window")
                 return False
                 
-            # Double verification
-            if not any(text in request_btn.text for text in request_texts):
-                logger.error("Request button text verification failed")
-                return False
-                
             # Scroll and click request button
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
                 request_btn
             )
-            long_random_delay(1, 2, "After scrolling to request button")
+            wait_for_dom_idle(self.driver)
+            random_delay(0.3, 0.8, "After scrolling to request button")
             
             self.driver.execute_script("arguments[0].click();", request_btn)
-            long_random_delay(3, 5, "After clicking request button")
+            wait_for_dom_idle(self.driver)
             
             # Wait for refund method selection with timeout
             try:
@@ -1107,47 +1545,33 @@ class TemuBot:
                 "Reembolso instantâneo"
             ]
             
-            for text in refund_texts:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, f"//div[contains(., '{text}')]")
-                    for element in elements:
-                        if text in element.text and element.is_displayed():
-                            refund_method = element
-                            logger.info(f"Found refund method: {text}")
-                            break
-                    if refund_method:
-                        break
-                except Exception:
-                    continue
+            refund_method, text = self._pick_visible_containing(
+                f"//div[{xpath_contains_any(refund_texts)}]", refund_texts
+            )
+            if refund_method:
+                logger.info(f"Found refund method: {text}")
                     
             if not refund_method:
                 logger.error("Valid refund method option not found")
                 return False
                 
-            # Double verification
-            if not any(text in refund_method.text for text in refund_texts):
-                logger.error("Refund method text verification failed")
-                return False
-                
             # Select refund method
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
                 refund_method
             )
-            long_random_delay(0.5, 1, "After scrolling to refund method")
-            
-            self.driver.execute_script("arguments[0].click();", refund_method)
-            long_random_delay(2, 4, "After selecting refund method")
+            wait_for_dom_idle(self.driver)
+            random_delay(0.3, 0.8, "After scrolling to refund method")
             
-            # Verify selection visually
-            try:
+            # Mark the selection visually when debugging
+            if self.verbose:
                 self.driver.execute_script(
-                    "arguments[0].style.border = '2px solid green';", 
+                    "arguments[0].click(); arguments[0].style.border = '2px solid green';", 
                     refund_method
                 )
-                long_random_delay(0.5, 1, "Highlighting selected method")
-            except Exception:
-                pass
+            else:
+                self.driver.execute_script("arguments[0].click();", refund_method)
+            wait_for_dom_idle(self.driver)
                 
             # Submit button with enhanced verification
             submit_btn = None
@@ -1160,81 +1584,48 @@ class TemuBot:
                 "Solicitar"
             ]
             
-            for text in submit_texts:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, f"//div[@role='button' and contains(., '{text}')]")
-                    for element in elements:
-                        if text in element.text and element.is_displayed():
-                            submit_btn = element
-                            logger.info(f"Found submit button: {text}")
-                            break
-                    if submit_btn:
-                        break
-                except Exception:
-                    continue
+            submit_btn, text = self._pick_visible_containing(
+                f"//div[@role='button' and ({xpath_contains_any(submit_texts)})]", submit_texts
+            )
+            if submit_btn:
+                logger.info(f"Found submit button: {text}")
                     
             if not submit_btn:
                 logger.error("Valid submit button not found")
                 return False
                 
-            # Double verification
-            if not any(text in submit_btn.text for text in submit_texts):
-                logger.error("Submit button text verification failed")
-                return False
-                
             # Submit request
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
                 submit_btn
             )
-            long_random_delay(1, 2, "After scrolling to submit button")
+            wait_for_dom_idle(self.driver)
+            random_delay(0.3, 0.8, "After scrolling to submit button")
             
             self.driver.execute_script("arguments[0].click();", submit_btn)
-            long_random_delay(5, 15, "After submitting request")
             
-            # Verify confirmation with multiple strategies
-            confirmation = False
-            refund_amount = "N/A"
-            confirmation_indicators = [
-                "Your refund is being processed",
-                "Reembolso está sendo processado",
-                "request has been submitted",
-                "solicitação foi enviada",
-                "successfully requested",
-                "solicitado com sucesso"
-            ]
-            
-            for text in confirmation_indicators:
-                try:
-                    element = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located(
-                            (By.XPATH, f"//*[contains(text(), '{text}')]")
-                        )
-                    )
-                    logger.info(f"Confirmation found: {text}")
-                    confirmation = True
-                    
-                    # Try to extract refund amount
-                    try:
-                        amount_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'refund-amount')]")
-                        for elem in amount_elements:
-                            if "$" in elem.text or "R$" in elem.text:
-                                refund_amount = elem.text.strip()
-                                break
-                        order['refund_amount'] = refund_amount
-                        logger.info(f"Refund amount detected: {refund_amount}")
-                    except Exception:
-                        logger.warning("Could not extract refund amount")
-                    
-                    break
-                except TimeoutException:
-                    continue
-                    
-            if not confirmation:
+            # Watch for every confirmation indicator at once, straight after the click
+            confirmation_text = wait_for_text(self.driver, self._CONFIRMATION_TEXTS, 20)
+            if not confirmation_text:
                 logger.error("Confirmation message not found")
                 self.save_page_source(f"adjustment_failure_{order['id']}")
                 return False
                 
+            logger.info(f"Confirmation found: {confirmation_text}")
+            
+            # Try to extract refund amount
+            refund_amount = "N/A"
+            try:
+                amount_elements = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='refund-amount']")
+                for elem in amount_elements:
+                    if "$" in elem.text or "R$" in elem.text:
+                        refund_amount = elem.text.strip()
+                        break
+                order['refund_amount'] = refund_amount
+                logger.info(f"Refund amount detected: {refund_amount}")
+            except Exception:
+                logger.warning("Could not extract refund amount")
+                
             logger.success(f"Price adjustment SUCCESS for order {order['id']}")
             return True
             
@@ -1242,7 +1633,7 @@ class TemuBot:
             logger.error(f"Price adjustment flow failed: {str(e)}")
             self.save_page_source(f"adjustment_error_{order['id']}")
             if self.verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             return False
         
     def print_summary(self):
@@ -1252,32 +1643,34 @@ class TemuBot:
             self.stats['end_time'] - self.stats['start_time']
         ).total_seconds() / 60
         
-        summary = f"""
-========================= EXECUTION SUMMARY =========================
-Total orders: {self.stats['total_orders']}
-Valid orders: {self.stats['valid_orders']}
-Processed orders: {self.stats['processed']}
-Successful adjustments: {self.stats['success']}
-Adjustment not available: {self.stats['adjustment_not_available']}
-Failures: {self.stats['failures']}
-Execution time: {self.stats['duration']:.2f} minutes
-=====================================================================
-"""
-        logger.info(summary)
-        self.print_summary_box(self.stats)
+        lines = self._format_summary_lines()
+        logger.info("\n".join([
+            "",
+            "========================= EXECUTION SUMMARY =========================",
+            *lines,
+            "=" * 69,
+            ""
+        ]))
+        self.print_summary_box(lines)
 
-    def print_summary_box(self, stats):
+    def _format_summary_lines(self):
+        """Return the execution statistics as summary lines."""
+        stats = self.stats
+        return [
+            f"Total orders: {stats['total_orders']}",
+            f"Valid orders: {stats['valid_orders']}",
+            f"Processed orders: {stats['processed']}",
+            f"Successful adjustments: {stats['success']}",
+            f"Adjustment not available: {stats['adjustment_not_available']}",
+            f"Failures: {stats['failures']}",
+            f"Execution time: {stats['duration']:.2f} minutes"
+        ]
+
+    def print_summary_box(self, lines):
         """Print formatted summary box with color coding."""
+        stats = self.stats
         title = "EXECUTION SUMMARY"
-        content = f"""
-Total orders: {stats['total_orders']}
-Valid orders: {stats['valid_orders']}
-Processed orders: {stats['processed']}
-Successful adjustments: {stats['success']}
-Adjustment not available: {stats['adjustment_not_available']}
-Failures: {stats['failures']}
-Execution time: {stats['duration']:.2f} minutes
-"""
+        
         # Color selection based on success
         if stats['success'] > 0:
             color = Fore.GREEN
@@ -1286,34 +1679,50 @@ Execution time: {stats['duration']:.2f} minutes
         else:
             color = Fore.YELLOW
             
-        reset = Style.RESET_ALL
-        border = color + "═" * (len(title) + 4) + reset
-        
-        print(f"{color}╔{border}╗{reset}")
-        print(f"{color}║  {title}  ║{reset}")
-        print(f"{color}╠{border}╣{reset}")
+        # Size the box to its widest line so the right edge lines up
+        width = max(len(line) for line in [title, *lines]) + 4
+        border = "═" * width
+        box = "\n".join([
+            f"╔{border}╗",
+            f"║{title.center(width)}║",
+            f"╠{border}╣",
+            *(f"║  {line.ljust(width - 4)}  ║" for line in lines),
+            f"╚{border}╝"
+        ])
         
-        for line in content.strip().split('\n'):
-            print(f"{color}║{line}║{reset}")
-            
-        print(f"{color}╚{border}╝{reset}")
+        # Colour the whole box with one escape pair and write it in one go
+        print(f"{color}{box}{Style.RESET_ALL}")
 
-    def run(self, immediate=False, verbose=False, headless=False):
-        """Main bot execution flow."""
+    def run(self, immediate=False, verbose=False, headless=False, workers=1, keep_driver=False):
+        """Main bot execution flow.
+        
+        With keep_driver the browser stays open for the next run in this process.
+        """
         self.verbose = verbose
-        self.captcha_solver = CaptchaSolver(verbose=verbose)
+        self.headless = headless
+        self.workers = max(1, workers)
+        # Keep the solver across scheduled runs so its setup is only paid once
+        if self.captcha_solver is None:
+            self.captcha_solver = CaptchaSolver(verbose=verbose)
+        self.captcha_solver.verbose = verbose
         global logger
         logger = setup_logger(verbose=verbose)
         self.logger = logger
         
         self.stats['start_time'] = datetime.now()
         logger.info("Starting TemuBot execution")
+        self._load_orders_once()
         
-        self.init_driver(headless)
+        if self.driver_alive():
+            logger.info("Reusing browser from previous run")
+        else:
+            self.init_driver(headless)
         
         try:
-            if self.login() and self.navigate_to_orders():
-                self.process_orders()
+            if self.login():
+                self.block_heavy_resources()
+                if self.navigate_to_orders():
+                    self.process_orders()
                 
             self.print_summary()
             
@@ -1324,40 +1733,73 @@ Execution time: {stats['duration']:.2f} minutes
         except Exception as e:
             logger.error(f"Critical error during execution: {str(e)}")
             if verbose:
-                logger.verbose(f"Stacktrace:\n{traceback.format_exc()}")
+                logger.verbose("Stacktrace", exc_info=True)
             self.print_summary()
         finally:
-            self.driver.quit()
+            self._flush_orders()
+            if keep_driver and self.driver_alive():
+                self.driver.get("about:blank")
+            else:
+                self.close()
+
+    def _load_orders_once(self):
+        """Read saved orders into memory on the first run of this process."""
+        if self._orders_by_id is None:
+            self._orders_by_id = load_orders_index()
+
+    def _flush_orders(self):
+        """Write this run's order updates to orders.json in one pass."""
+        if self._orders_by_id is not None:
+            write_orders_snapshot(self._orders_by_id)
+
+    def driver_alive(self):
+        """Check whether the current browser session still responds."""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        """Quit the browser if one is open."""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+
+
+def to_cdp_cookie(cookie):
+    """Convert a WebDriver cookie dict to the CDP Network.CookieParam shape."""
+    cdp_cookie = {
+        key: cookie[key]
+        for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')
+        if key in cookie
+    }
+    if 'domain' not in cdp_cookie:
+        cdp_cookie['url'] = "https://www.temu.com"
+    if 'expiry' in cookie:
+        cdp_cookie['expires'] = cookie['expiry']
+    if isinstance(cookie.get('sameSite'), str):
+        cdp_cookie['sameSite'] = cookie['sameSite']
+    return cdp_cookie
 
 
 def parse_order_date(date_str):
     """Parse order date from various string formats."""
     try:
-        patterns = [
-            r'([A-Z][a-z]{2} \d{1,2},? \d{4})',
-            r'(\d{1,2} [A-Z][a-z]{2} \d{4})',
-            r'([A-Z][a-z]{2} \d{1,2})',
-            r'(\d{1,2}/\d{1,2}/\d{4})',
-            r'(\d{1,2}-\d{1,2}-\d{4})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
+        for pattern, formats in _DATE_PATTERNS:
+            match = pattern.search(date_str)
             if match:
                 date_part = match.group(1).replace(',', '')
-                try:
-                    return datetime.strptime(date_part, "%b %d %Y")
-                except Exception:
+                for fmt in formats:
                     try:
-                        return datetime.strptime(date_part, "%d %b %Y")
-                    except Exception:
-                        try:
-                            return datetime.strptime(date_part, "%d/%m/%Y")
-                        except Exception:
-                            try:
-                                return datetime.strptime(date_part, "%m/%d/%Y")
-                            except Exception:
-                                continue
+                        return datetime.strptime(date_part, fmt)
+                    except ValueError:
+                        continue
                                 
         if "Order time:" in date_str:
             parts = date_str.split("Order time:")
@@ -1371,61 +1813,6 @@ def parse_order_date(date_str):
         return None
 
 
-def validate_order_date(order_date):
-    """Validate if order is within 30-day adjustment window."""
-    if order_date is None:
-        return False
-        
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    return order_date >= thirty_days_ago
-
-
-def save_order_data(order):
-    """Save order data to JSON file."""
-    try:
-        # Clean up un-serializable elements
-        if 'element' in order:
-            del order['element']
-            
-        for key in list(order.keys()):
-            if isinstance(order[key], webdriver.remote.webelement.WebElement):
-                del order[key]
-                
-        # Convert datetime objects
-        if 'date_obj' in order and order['date_obj']:
-            order['date_obj'] = order['date_obj'].isoformat()
-            
-        # Load existing data
-        orders = []
-        file_path = "orders.json"
-        
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r') as f:
-                    orders = json.load(f)
-            except (json.JSONDecodeError, Exception) as e:
-                logger.warning(f"Corrupted orders file, resetting: {str(e)}")
-                orders = []
-                
-        # Update or add new order
-        existing = next((o for o in orders if o['id'] == order['id']), None)
-        if existing:
-            existing.update(order)
-        else:
-            orders.append(order)
-            
-        # Save to file
-        with open(file_path, 'w') as f:
-            json.dump(orders, f, indent=2, default=str)
-            
-        logger.info("Order data saved successfully")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error saving order data: {str(e)}")
-        return False
-
-
 def main():
     """Main entry point with command-line arguments."""
     parser = argparse.ArgumentParser(description='Temu Price Adjustment Bot')
@@ -1433,26 +1820,26 @@ def main():
     parser.add_argument('--schedule', action='store_true', help='Run the bot on scheduled intervals')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging with stack traces')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
+    parser.add_argument('--workers', type=int, default=1, help='Number of browsers used to process orders in parallel')
     args = parser.parse_args()
     
     bot = TemuBot()
     
     if args.now:
-        bot.run(immediate=True, verbose=args.verbose, headless=args.headless)
+        bot.run(immediate=True, verbose=args.verbose, headless=args.headless, workers=args.workers)
     elif args.schedule:
         next_run = bot.scheduler.get_next_run_time()
         logger.info(f"Next run scheduled at: {next_run.strftime('%d/%m/%Y - %H:%M:%S')}")
         
-        while True:
-            current_time = datetime.now()
-            if current_time >= next_run:
-                bot.run(verbose=args.verbose, headless=args.headless)
+        try:
+            while True:
+                # Sleep straight to the deadline; get_next_run_time already adds the jitter
+                time.sleep(max(0, (next_run - datetime.now()).total_seconds()))
+                bot.run(verbose=args.verbose, headless=args.headless, workers=args.workers, keep_driver=True)
                 next_run = bot.scheduler.get_next_run_time()
                 logger.info(f"Next run scheduled at: {next_run.strftime('%d/%m/%Y - %H:%M:%S')}")
-                
-            sleep_time = random.randint(300, 1800)
-            logger.info(f"Sleeping for {sleep_time} seconds")
-            time.sleep(sleep_time)
+        finally:
+            bot.close()
     else:
         print("Please specify a run mode: --now or --schedule")
 
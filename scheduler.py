@@ -1,28 +1,56 @@
 from datetime import datetime, timedelta
 import random
 import pickle
+import mmap
+import operator
 import os
-from config import Config
+from config import get_config
 
 class Scheduler:
+    # Models already loaded in this process, keyed by path
+    _models = {}
+    
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.success_hours = {}
+        self._best_hour = None
         self.load_model()
     
     def load_model(self):
-        if os.path.exists(self.config.ML_MODEL_PATH):
-            with open(self.config.ML_MODEL_PATH, 'rb') as f:
-                self.model = pickle.load(f)
+        path = self.config.ML_MODEL_PATH
+        if path in Scheduler._models:
+            self.model = Scheduler._models[path]
+        elif os.path.exists(path):
+            # Unpickle straight from the page cache instead of copying the file into memory first
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self.model = pickle.loads(mm)
+                    protocol = mm[1] if mm[0] == 0x80 else 0
+            # Upgrade pickles written with an older protocol; the loaded copy is usable either way
+            if protocol < pickle.HIGHEST_PROTOCOL:
+                try:
+                    self.save_model()
+                except OSError:
+                    pass
+            Scheduler._models[path] = self.model
         else:
             self.model = None
     
+    def save_model(self):
+        path = self.config.ML_MODEL_PATH
+        # Write beside the model and swap it in, so a crash never truncates the only copy
+        tmp_file = path + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(self.model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+        Scheduler._models[path] = self.model
+    
     def update_success_hour(self, hour):
         self.success_hours[hour] = self.success_hours.get(hour, 0) + 1
-        self.train_model()
-    
-    def train_model(self):
-        pass
+        # Recomputed on the next prediction
+        self._best_hour = None
     
     def get_next_run_time(self):
         best_hour = self.predict_best_hour()
@@ -37,6 +65,8 @@ class Scheduler:
         return next_run
     
     def predict_best_hour(self):
-        if self.success_hours:
-            return max(self.success_hours, key=self.success_hours.get)
-        return random.randint(9, 17)
\ No newline at end of file
+        if not self.success_hours:
+            return random.randint(9, 17)
+        if self._best_hour is None:
+            self._best_hour = max(self.success_hours.items(), key=operator.itemgetter(1))[0]
+        return self._best_hour
\ No newline at end of file
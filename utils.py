@@ -2,17 +2,66 @@ import time
 import random
 import os
 import re
-import traceback
-import glob
+import json
+import queue
+import threading
+import atexit
 from datetime import datetime
-from colorama import Fore, Style
+from itertools import groupby
+from pathlib import Path
+from types import MappingProxyType
+from selenium.webdriver.remote.webelement import WebElement
+from config import get_config
 from logger import setup_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = setup_logger()
+_config = get_config()
 
 SHORT_DELAY = (0.5, 5.0)
 LONG_DELAY = (10.0, 60.0)
 
+# "Updated at" stamp in order reports
+UPDATED_AT_FORMAT = '%d.%m.%Y at %H:%M:%S'
+
+# Report file prefix and description for each adjustment status
+_STATUS_MAP = MappingProxyType({
+    'success': 'SUCESSO',
+    'not_available': 'INDISPONIVEL',
+    'failed': 'FALHA',
+    'not_attempted': 'NAO_TENTADO',
+    'unknown': 'DESCONHECIDO'
+})
+
+_STATUS_DESC = MappingProxyType({
+    'success': 'Reembolso solicitado com sucesso',
+    'not_available': 'Reembolso não disponível para este pedido',
+    'failed': 'Falha ao solicitar reembolso',
+    'not_attempted': 'Reembolso não foi tentado',
+    'unknown': 'Status desconhecido'
+})
+
+_MONTH_NAMES = MappingProxyType({
+    'Jan': 'January', 'Feb': 'February', 'Mar': 'March',
+    'Apr': 'April', 'May': 'May', 'Jun': 'June',
+    'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
+    'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
+})
+
+# Characters not allowed in order file names
+_FILENAME_UNSAFE = str.maketrans('', '', '\\/*?:"<>|')
+
+# Delivery date ranges: "MMM dd-dd", "dd-dd MMM" and "dd MMM - dd MMM"
+_DELIVERY_RE = re.compile(
+    r'\b(?P<m1>\w{3}) (?P<d1s>\d{1,2})-(?P<d1e>\d{1,2})'
+    r'|(?P<d2s>\d{1,2})-(?P<d2e>\d{1,2}) (?P<m2>\w{3})\b'
+    r'|(?P<d3s>\d{1,2}) (?P<m3>\w{3}) - (?P<d3e>\d{1,2}) \w{3}\b'
+)
+
 def random_delay(min_sec=None, max_sec=None, reason=None):
     min_val = min_sec or SHORT_DELAY[0]
     max_val = max_sec or SHORT_DELAY[1]
@@ -36,31 +85,79 @@ def long_random_delay(min_sec=None, max_sec=None, reason=None):
         logger.info(f"Long delay completed")
     return delay
 
-def save_order_to_txt(order, folder="orders"):
+# Pending (path, mode, data) file operations, run in order by the writer thread
+_write_queue = queue.Queue()
+
+def _write_files():
+    while True:
+        batch = [_write_queue.get()]
+        try:
+            while True:
+                batch.append(_write_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        for (path, mode), group in groupby(batch, key=lambda item: item[:2]):
+            chunks = [data for _, _, data in group]
+            try:
+                if mode == 'rm':
+                    os.remove(path)
+                    logger.info(f"Removed old order file: {os.path.basename(path)}")
+                elif mode == 'ab':
+                    # Back-to-back appends to one file go out in a single write and a single fsync
+                    with open(path, 'ab') as f:
+                        f.write(b"".join(chunks))
+                        f.flush()
+                        os.fsync(f.fileno())
+                else:
+                    # Only the last of several rewrites of one file matters
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write(chunks[-1])
+            except FileNotFoundError as e:
+                # An old report already deleted by hand needs no removal
+                if mode != 'rm':
+                    logger.error(f"Error writing {path}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Error writing {path}: {str(e)}")
+        
+        for _ in batch:
+            _write_queue.task_done()
+
+def flush_writes():
+    _write_queue.join()
+
+threading.Thread(target=_write_files, name="order-writer", daemon=True).start()
+atexit.register(flush_writes)
+
+# Existing order files per folder, keyed by sanitized order name
+_order_files = {}
+
+def _order_file_index(folder):
+    index = _order_files.get(folder)
+    if index is None:
+        # One directory scan per folder; save_order_to_txt keeps the index current afterwards
+        index = {}
+        prefixes = tuple(f"{code}_" for code in _STATUS_MAP.values())
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.txt'):
+                    continue
+                for prefix in prefixes:
+                    if name.startswith(prefix):
+                        index.setdefault(name[len(prefix):-4], []).append(name)
+                        break
+        _order_files[folder] = index
+    return index
+
+def save_order_to_txt(order, folder="orders", updated_at=None):
     if not os.path.exists(folder):
         os.makedirs(folder)
     
-    # Status mapping with detailed descriptions
-    status_map = {
-        'success': 'SUCESSO',
-        'not_available': 'INDISPONIVEL',
-        'failed': 'FALHA',
-        'not_attempted': 'NAO_TENTADO',
-        'unknown': 'DESCONHECIDO'
-    }
-    
-    status_description = {
-        'success': 'Reembolso solicitado com sucesso',
-        'not_available': 'Reembolso não disponível para este pedido',
-        'failed': 'Falha ao solicitar reembolso',
-        'not_attempted': 'Reembolso não foi tentado',
-        'unknown': 'Status desconhecido'
-    }
-    
     # Get status info
     status = order.get('adjustment_status', 'unknown')
-    status_code = status_map.get(status, 'DESCONHECIDO')
-    description = status_description.get(status, 'Status desconhecido')
+    status_code = _STATUS_MAP.get(status, 'DESCONHECIDO')
+    description = _STATUS_DESC.get(status, 'Status desconhecido')
     
     # Get tracking number or fallback to order ID
     tracking_info = order.get('tracking_info', {})
@@ -68,23 +165,20 @@ def save_order_to_txt(order, folder="orders"):
     base_name = tracking_number if tracking_number != 'N/A' else order.get('id', 'N/A')
     
     # Sanitize base name for filename
-    safe_name = re.sub(r'[\\/*?:"<>|]', '', base_name)
+    safe_name = base_name.translate(_FILENAME_UNSAFE)
     
     # Create filename
     filename = f"{status_code}_{safe_name}.txt"
     filepath = os.path.join(folder, filename)
     
     # Delete previous files for this order
-    pattern = os.path.join(folder, f"*_{safe_name}.txt")
-    for old_file in glob.glob(pattern):
-        try:
-            os.remove(old_file)
-            logger.info(f"Removed old order file: {os.path.basename(old_file)}")
-        except Exception as e:
-            logger.error(f"Error removing old order file {old_file}: {str(e)}")
+    order_files = _order_file_index(folder)
+    for old_name in order_files.pop(safe_name, []):
+        _write_queue.put((os.path.join(folder, old_name), 'rm', None))
     
     # Prepare content
-    content = f"""Updated at: {datetime.now().strftime('%d.%m.%Y at %H:%M:%S')}
+    updated_at = updated_at or datetime.now().strftime(UPDATED_AT_FORMAT)
+    parts = [f"""Updated at: {updated_at}
 
 Order ID: {order.get('id', 'N/A')}
 Tracking Number: {tracking_number}
@@ -95,105 +189,106 @@ Order Time: {order.get('date_str', 'N/A')}
 ===== STATUS DO REEMBOLSO =====
 Status: {description}
 Tentativa realizada: {'Sim' if order.get('adjustment_attempted', False) else 'Não'}
-Sucesso: {'Sim' if order.get('adjustment_success', False) else 'Não'}"""
+Sucesso: {'Sim' if order.get('adjustment_success', False) else 'Não'}"""]
 
     # Add refund amount if available
     if 'refund_amount' in order:
-        content += f"\nValor do reembolso: {order['refund_amount']}"
+        parts.append(f"\nValor do reembolso: {order['refund_amount']}")
     
     # Add attempts and error info
-    content += f"""
+    parts.append(f"""
 Tentativas: {order.get('attempts', 0)}/5
 Último erro: {order.get('last_error', 'Nenhum')}
-"""
+""")
 
     # Write to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    _write_queue.put((filepath, 'w', "".join(parts)))
+    order_files[safe_name] = [filename]
     
-    logger.info(f"Order details saved to: {filename}")
+    logger.info(f"Order details queued for: {filename}")
+
+def json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def dump_json(value):
+    # orjson when installed; both paths return compact UTF-8 bytes
+    if orjson:
+        return orjson.dumps(value, default=json_default)
+    return json.dumps(value, default=json_default, separators=(',', ':')).encode('utf-8')
 
-def validate_date(order_date):
-    from datetime import timedelta
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    return order_date >= thirty_days_ago
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the same error either way
+load_json = orjson.loads if orjson else json.loads
+
+def load_orders_index():
+    orders = {}
+    if os.path.exists(_config.ORDERS_FILE):
+        try:
+            orders = {o['id']: o for o in load_json(Path(_config.ORDERS_FILE).read_bytes())}
+        except Exception as e:
+            logger.warning(f"Corrupted orders file, resetting: {str(e)}")
+    
+    # Replay updates journaled since the last snapshot
+    if os.path.exists(_config.ORDERS_JOURNAL_FILE):
+        for line in Path(_config.ORDERS_JOURNAL_FILE).read_bytes().splitlines():
+            try:
+                order = load_json(line)
+            except json.JSONDecodeError:
+                # Last line may be cut short by a crash mid-write
+                continue
+            orders[order['id']] = order
+    
+    return orders
 
-def save_order_data(order):
-    from config import Config
-    import json
-    config = Config()
+def save_order_data(order, orders_by_id):
     try:
         # Remove non-serializable elements
-        if 'element' in order:
-            del order['element']
-        for key in list(order.keys()):
-            if "WebElement" in str(type(order[key])):
-                del order[key]
+        order = {key: value for key, value in order.items() if not isinstance(value, WebElement)}
         
-        # Convert datetime objects to ISO format
-        if 'date_obj' in order and order['date_obj']:
-            if isinstance(order['date_obj'], datetime):
-                order['date_obj'] = order['date_obj'].isoformat()
+        # Update existing order or add new
+        record = orders_by_id.setdefault(order['id'], {})
+        record.update(order)
         
-        orders = []
-        if os.path.exists(config.ORDERS_FILE):
-            try:
-                with open(config.ORDERS_FILE, 'r') as f:
-                    orders = json.load(f)
-            except json.JSONDecodeError:
-                orders = []
+        # Append only this record; write_orders_snapshot folds the journal back into ORDERS_FILE
+        _write_queue.put((_config.ORDERS_JOURNAL_FILE, 'ab', dump_json(record) + b"\n"))
         
-        # Update existing order or add new
-        existing = next((o for o in orders if o['id'] == order['id']), None)
-        if existing:
-            existing.update(order)
-        else:
-            orders.append(order)
-            
-        with open(config.ORDERS_FILE, 'w') as f:
-            json.dump(orders, f, indent=2, default=str)
+        logger.info("Order data saved successfully")
         return True
     except Exception as e:
         logger.error(f"Error saving order data: {str(e)}")
         return False
 
+def write_orders_snapshot(orders_by_id):
+    flush_writes()
+    # No journal means nothing changed since the last snapshot
+    if not os.path.exists(_config.ORDERS_JOURNAL_FILE):
+        return
+    try:
+        tmp_file = _config.ORDERS_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(dump_json(list(orders_by_id.values())))
+            # The snapshot must be on disk before the rename makes it the only copy
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, _config.ORDERS_FILE)
+        os.remove(_config.ORDERS_JOURNAL_FILE)
+    except Exception as e:
+        logger.error(f"Error writing orders snapshot: {str(e)}")
+
 def parse_delivery_date(delivery_text):
     try:
-        month_names = {
-            'Jan': 'January', 'Feb': 'February', 'Mar': 'March',
-            'Apr': 'April', 'May': 'May', 'Jun': 'June',
-            'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
-            'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
-        }
-        
-        # Match different date formats
-        patterns = [
-            r'(\w{3} \d{1,2}-\d{1,2})',
-            r'(\d{1,2}-\d{1,2} \w{3})',
-            r'(\d{1,2} \w{3} - \d{1,2} \w{3})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, delivery_text)
-            if match:
-                date_range = match.group(1)
-                if '-' in date_range:
-                    parts = date_range.split(' ')
-                    if len(parts) == 2:  # "MMM dd-dd"
-                        month, days = parts
-                        start_day, end_day = days.split('-')
-                        return f"{start_day} to {end_day} {month_names.get(month, month)}"
-                    else:  # "dd-dd MMM"
-                        days, month = date_range.split(' ')
-                        start_day, end_day = days.split('-')
-                        return f"{start_day} to {end_day} {month_names.get(month, month)}"
-                elif ' - ' in date_range:  # "dd MMM - dd MMM"
-                    start, end = date_range.split(' - ')
-                    start_parts = start.split(' ')
-                    end_parts = end.split(' ')
-                    return f"{start_parts[0]} to {end_parts[0]} {month_names.get(start_parts[1], start_parts[1])}"
+        match = _DELIVERY_RE.search(delivery_text)
+        if not match:
+            return delivery_text
         
-        return delivery_text
+        if match['m1']:  # "MMM dd-dd"
+            start_day, end_day, month = match['d1s'], match['d1e'], match['m1']
+        elif match['m2']:  # "dd-dd MMM"
+            start_day, end_day, month = match['d2s'], match['d2e'], match['m2']
+        else:  # "dd MMM - dd MMM"
+            start_day, end_day, month = match['d3s'], match['d3e'], match['m3']
+        return f"{start_day} to {end_day} {_MONTH_NAMES.get(month, month)}"
     except Exception as e:
         logger.warning(f"Error parsing delivery date: {str(e)}")
         return delivery_text
\ No newline at end of file